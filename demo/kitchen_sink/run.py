@@ -5,8 +5,34 @@ import numpy as np
 
 import gradio as gr
 
+_rng = np.random.default_rng()
+
 CHOICES = ["foo", "bar", "baz"]
 JSONOBJ = """{"items":{"item":[{"id": "0001","type": null,"is_good": false,"ppu": 0.55,"batters":{"batter":[{ "id": "1001", "type": "Regular" },{ "id": "1002", "type": "Chocolate" },{ "id": "1003", "type": "Blueberry" },{ "id": "1004", "type": "Devil's Food" }]},"topping":[{ "id": "5001", "type": "None" },{ "id": "5002", "type": "Glazed" },{ "id": "5005", "type": "Sugar" },{ "id": "5007", "type": "Powdered Sugar" },{ "id": "5006", "type": "Chocolate with Sprinkles" },{ "id": "5003", "type": "Chocolate" },{ "id": "5004", "type": "Maple" }]}]}}"""
+PARSED_JSONOBJ = json.loads(JSONOBJ)
+HIGHLIGHTED_TEXT = [
+    ("The", "art"),
+    ("quick brown", "adj"),
+    ("fox", "nn"),
+    ("jumped", "vrb"),
+    ("testing testing testing", None),
+    ("over", "prp"),
+    ("the", "art"),
+    ("testing", None),
+    ("lazy", "adj"),
+    ("dogs", "nn"),
+    (".", "punc"),
+] + [(f"test {x}", f"test {x}") for x in range(10)]
+# [("The testing testing testing", None), ("quick brown", 0.2), ("fox", 1), ("jumped", -1), ("testing testing testing", 0), ("over", 0), ("the", 0), ("testing", 0), ("lazy", 1), ("dogs", 0), (".", 1)] + [(f"test {x}",  x/10) for x in range(-10, 10)]
+HIGHLIGHTED_SCORES = [
+    ("The testing testing testing", None),
+    ("over", 0.6),
+    ("the", 0.2),
+    ("testing", None),
+    ("lazy", -0.1),
+    ("dogs", 0.4),
+    (".", 0),
+] + [("test", x / 10) for x in range(-10, 10)]
 
 
 def fn(
@@ -39,43 +65,20 @@ def fn(
             "negative": slider1 / (num + slider1 + slider2),
             "neutral": slider2 / (num + slider1 + slider2),
         },  # Label
-        (audio1[0], np.flipud(audio1[1]))
+        (audio1[0], audio1[1][::-1])
         if audio1 is not None
         else os.path.join(os.path.dirname(__file__),"files/cantina.wav"),  # Audio
-        np.flipud(im1) if im1 is not None else os.path.join(os.path.dirname(__file__),"files/cheetah1.jpg"),  # Image
+        im1[::-1] if im1 is not None else os.path.join(os.path.dirname(__file__),"files/cheetah1.jpg"),  # Image
         video if video is not None else os.path.join(os.path.dirname(__file__),"files/world.mp4"),  # Video
-        [
-            ("The", "art"),
-            ("quick brown", "adj"),
-            ("fox", "nn"),
-            ("jumped", "vrb"),
-            ("testing testing testing", None),
-            ("over", "prp"),
-            ("the", "art"),
-            ("testing", None),
-            ("lazy", "adj"),
-            ("dogs", "nn"),
-            (".", "punc"),
-        ]
-        + [(f"test {x}", f"test {x}") for x in range(10)],  # HighlightedText
-        # [("The testing testing testing", None), ("quick brown", 0.2), ("fox", 1), ("jumped", -1), ("testing testing testing", 0), ("over", 0), ("the", 0), ("testing", 0), ("lazy", 1), ("dogs", 0), (".", 1)] + [(f"test {x}",  x/10) for x in range(-10, 10)],  # HighlightedText
-        [
-            ("The testing testing testing", None),
-            ("over", 0.6),
-            ("the", 0.2),
-            ("testing", None),
-            ("lazy", -0.1),
-            ("dogs", 0.4),
-            (".", 0),
-        ]
-        + [(f"test", x / 10) for x in range(-10, 10)],  # HighlightedText
-        json.loads(JSONOBJ),  # JSON
+        HIGHLIGHTED_TEXT,  # HighlightedText
+        HIGHLIGHTED_SCORES,  # HighlightedText
+        PARSED_JSONOBJ,  # JSON
         "<button style='background-color: red'>Click Me: "
         + radio
         + "</button>",  # HTML
         os.path.join(os.path.dirname(__file__),"files/titanic.csv"),
         df1,  # Dataframe
-        np.random.randint(0, 10, (4, 4)),  # Dataframe
+        _rng.integers(0, 10, (4, 4), dtype=np.int8),  # Dataframe
         [
             im for im in [im1, im2, im3, im4, os.path.join(os.path.dirname(__file__),"files/cheetah1.jpg")] if im is not None
         ],  # Carousel
@@ -12,11 +12,11 @@ demo = gr.Interface(
     gr.Dataframe(type="numpy", datatype="number", row_count=5, col_count=3),
     "numpy",
     examples=[
-        [np.zeros((3, 3)).tolist()],
-        [np.ones((2, 2)).tolist()],
-        [np.random.randint(0, 10, (3, 10)).tolist()],
-        [np.random.randint(0, 10, (10, 3)).tolist()],
-        [np.random.randint(0, 10, (10, 10)).tolist()],
+        [np.zeros((3, 3))],
+        [np.ones((2, 2))],
+        [np.random.randint(0, 10, (3, 10))],
+        [np.random.randint(0, 10, (10, 3))],
+        [np.random.randint(0, 10, (10, 10))],
     ],
 )
 
@@ -1,5 +1,3 @@
-import pkg_resources
-
 import gradio.components as components
 import gradio.inputs as inputs
 import gradio.outputs as outputs
@@ -42,7 +40,7 @@ from gradio.flagging import (
 )
 from gradio.interface import Interface, TabbedInterface, close_all, reset_all
 from gradio.mix import Parallel, Series
-from gradio.routes import get_state, set_state
+from gradio.routes import get_state, get_version, set_state
 
-current_pkg_version = pkg_resources.require("gradio")[0].version
+current_pkg_version = get_version()
 __version__ = current_pkg_version
@@ -29,6 +29,11 @@ class Component(Block):
     A base class for defining the methods that all gradio components should have.
     """
 
+    # (type, description) of the data the component accepts from and returns to
+    # the API, as shown on the /api docs page.
+    preprocess_doc = ("Any", "input data")
+    postprocess_doc = ("Any", "output data")
+
     def __init__(
         self,
         *,
@@ -243,6 +248,9 @@ class Textbox(Component):
     Demos: hello_world, diff_texts, sentence_builder
     """
 
+    preprocess_doc = ("str", "text input")
+    postprocess_doc = ("str", "text output")
+
     def __init__(
         self,
         default_value: str = "",
@@ -441,6 +449,9 @@ class Number(Component):
     Demos: tax_calculator, titanic_survival
     """
 
+    preprocess_doc = ("number", "numeric input")
+    postprocess_doc = ("number", "numeric output")
+
     def __init__(
         self,
         default_value: Optional[float] = None,
@@ -465,7 +476,7 @@ class Number(Component):
     def preprocess(self, x: float | None) -> Optional[float]:
         """
         Parameters:
-        x (string): numeric input as a string
+        x (number): numeric input
         Returns:
         (float): number representing function input
         """
@@ -527,7 +538,10 @@ class Number(Component):
     # Output Functionalities
     def postprocess(self, y: float | None):
         """
-        Any postprocessing needed to be performed on function output.
+        Parameters:
+        y (float): numeric output
+        Returns:
+        (number): numeric output
         """
         if y is None:
             return None
@@ -587,6 +601,9 @@ class Slider(Component):
     Demos: sentence_builder, generate_tone, titanic_survival
     """
 
+    preprocess_doc = ("number", "numeric input")
+    postprocess_doc = ("number", "numeric output")
+
     def __init__(
         self,
         default_value: Optional[float] = None,
@@ -713,6 +730,9 @@ class Checkbox(Component):
     Demos: sentence_builder, titanic_survival
     """
 
+    preprocess_doc = ("bool", "boolean input")
+    postprocess_doc = ("bool", "boolean output")
+
     def __init__(
         self,
         default_value: bool = False,
@@ -813,6 +833,9 @@ class CheckboxGroup(Component):
     Demos: sentence_builder, titanic_survival, fraud_detector
     """
 
+    preprocess_doc = ("List[str]", "list of selected choices")
+    postprocess_doc = ("List[str]", "list of selected choices")
+
     def __init__(
         self,
         choices: List[str],
@@ -950,6 +973,9 @@ class Radio(Component):
     Demos: sentence_builder, tax_calculator, titanic_survival
     """
 
+    preprocess_doc = ("str", "selected choice")
+    postprocess_doc = ("str", "selected choice")
+
     def __init__(
         self,
         choices: List[str],
@@ -1103,6 +1129,9 @@ class Image(Component):
     Demos: image_classifier, image_mod, webcam, digit_classifier
     """
 
+    preprocess_doc = ("str", "base64 url data")
+    postprocess_doc = ("str", "base64 url data")
+
     def __init__(
         self,
         default_value: Optional[str] = None,
@@ -1438,6 +1467,13 @@ class Video(Component):
     Demos: video_flip
     """
 
+    preprocess_doc = (
+        "Dict[name: str, data: str]",
+        "JSON object with filename as 'name' property and base64 data as 'data' "
+        "property",
+    )
+    postprocess_doc = ("str", "base64 url data")
+
     def __init__(
         self,
         default_value: str = "",
@@ -1610,6 +1646,13 @@ class Audio(Component):
     Demos: main_note, generate_tone, reverse_audio, spectogram
     """
 
+    preprocess_doc = (
+        "Dict[name: str, data: str]",
+        "JSON object with filename as 'name' property and base64 data as 'data' "
+        "property",
+    )
+    postprocess_doc = ("str", "base64 url data")
+
     def __init__(
         self,
         default_value="",
@@ -1921,6 +1964,17 @@ class File(Component):
     Demos: zip_to_json, zip_two_files
     """
 
+    preprocess_doc = (
+        "List[Dict[name: str, data: str]]",
+        "List of JSON objects with filename as 'name' property and base64 data as "
+        "'data' property",
+    )
+    postprocess_doc = (
+        "Dict[name: str, size: number, data: str]",
+        "JSON object with key 'name' for filename, 'data' for base64 url, and "
+        "'size' for filesize in bytes",
+    )
+
     def __init__(
         self,
         default_value: str = "",
@@ -2067,6 +2121,16 @@ class Dataframe(Component):
     Demos: filter_records, matrix_transpose, tax_calculator
     """
 
+    preprocess_doc = (
+        "List[List[Union[str, number, bool]]]",
+        "2D array of str, numeric, or bool data",
+    )
+    postprocess_doc = (
+        "Dict[headers: List[str], data: List[List[Union[str, number]]]]",
+        "JSON object with key 'headers' for list of header names, 'data' for 2D "
+        "array of string or numeric data",
+    )
+
     def __init__(
         self,
         default_value: Optional[List[List[Any]]] = None,
@@ -2244,6 +2308,19 @@ class Timeseries(Component):
     Demos: fraud_detector
     """
 
+    preprocess_doc = (
+        "Dict[data: List[List[Union[str, number, bool]]], headers: List[str], "
+        "range: List[number]]",
+        "Dict with keys 'data': 2D array of str, numeric, or bool data, 'headers': "
+        "list of strings for header names, 'range': optional two element list "
+        "designating start of end of subrange.",
+    )
+    postprocess_doc = (
+        "Dict[headers: List[str], data: List[List[Union[str, number]]]]",
+        "JSON object with key 'headers' for list of header names, 'data' for 2D "
+        "array of string or numeric data",
+    )
+
     def __init__(
         self,
         default_value: Optional[str] = None,
@@ -2381,6 +2458,12 @@ class Label(Component):
     Demos: image_classifier, main_note, titanic_survival
     """
 
+    postprocess_doc = (
+        "Dict[label: str, confidences: List[Dict[label: str, confidence: number]]]",
+        "Object with key 'label' representing primary label, and key 'confidences' "
+        "representing a list of label-confidence pairs",
+    )
+
     CONFIDENCES_KEY = "confidences"
 
     def __init__(
@@ -2528,6 +2611,11 @@ class HighlightedText(Component):
     Demos: diff_texts, text_analysis
     """
 
+    postprocess_doc = (
+        "List[Tuple[str, Union[str, number]]]",
+        "list of key value pairs",
+    )
+
     def __init__(
         self,
         default_value: str = "",
@@ -2601,6 +2689,8 @@ class JSON(Component):
     Demos: zip_to_json
     """
 
+    postprocess_doc = ("Union[Dict, List]", "JSON output")
+
     def __init__(
         self,
         default_value: str = "",
@@ -2668,6 +2758,8 @@ class HTML(Component):
     Demos: text_analysis
     """
 
+    postprocess_doc = ("str", "HTML output")
+
     def __init__(
         self,
         default_value: str = "",
@@ -2725,6 +2817,12 @@ class Carousel(Component):
     Demos: disease_report
     """
 
+    postprocess_doc = (
+        "List[List[Any]]",
+        "2D array, where each sublist represents one set of outputs or 'slide' in "
+        "the carousel",
+    )
+
     def __init__(
         self,
         default_value="",
@@ -2825,6 +2923,11 @@ class Chatbot(Component):
     Demos: chatbot
     """
 
+    postprocess_doc = (
+        "List[Tuple[str, str]]",
+        "list of tuples representing the message and response",
+    )
+
     def __init__(
         self,
         default_value="",
@@ -2882,6 +2985,17 @@ class Model3D(Component):
     Demos: Model3D
     """
 
+    preprocess_doc = (
+        "Dict[name: str, data: str]",
+        "JSON object with filename as 'name' property and base64 data as 'data' "
+        "property",
+    )
+    postprocess_doc = (
+        "Dict[name: str, data: str]",
+        "JSON object with filename as 'name' property and base64 url data as 'data' "
+        "property",
+    )
+
     def __init__(
         self,
         clear_color=None,
@@ -2950,9 +3064,7 @@ class Model3D(Component):
         Parameters:
         y (str): path to the model
         Returns:
-        (str): file name
-        (str): file extension
-        (str): base64 url data
+        (Dict[name: str, data: str]): JSON object with filename as 'name' property and base64 url data as 'data' property
         """
 
         if self.clear_color is None:
@@ -3007,6 +3119,12 @@ class Plot(Component):
     Demos: outbreak_forecast
     """
 
+    postprocess_doc = (
+        "Dict[type: str, plot: str]",
+        "JSON object with the plot type as 'type' and the plot as base64 or json as "
+        "'plot'",
+    )
+
     def __init__(
         self,
         type: str = None,
@@ -3030,8 +3148,7 @@ class Plot(Component):
         Parameters:
         y (str): plot data
         Returns:
-        (str): plot type
-        (str): plot base64 or json
+        (Dict[type: str, plot: str]): JSON object with the plot type as 'type' and the plot as base64 or json as 'plot'
         """
         dtype = self.type
         if self.type == "plotly":
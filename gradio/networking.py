@@ -134,6 +134,11 @@ def start_server(
     else:
         app.auth = None
     app.blocks = blocks
+    app.state_defaults = {
+        _id: getattr(block, "default_value", None)
+        for _id, block in blocks.blocks.items()
+        if getattr(block, "stateful", False)
+    }
     app.cwd = os.getcwd()
     app.favicon_path = blocks.favicon_path
     app.tokens = {}
@@ -154,6 +159,7 @@ def start_server(
         port=port,
         host=server_name,
         log_level="warning",
+        access_log=False,
         ssl_keyfile=ssl_keyfile,
         ssl_certfile=ssl_certfile,
         ssl_keyfile_password=ssl_keyfile_password,
@@ -3,12 +3,10 @@ import os
 import sqlite3
 import time
 import uuid
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
 
 import requests
 
-from gradio.routes import QueuePushBody
-
 DB_FILE = "gradio_queue.db"
 
 
@@ -108,9 +106,9 @@ def pop() -> Tuple[int, str, Dict, str]:
     return result[0], result[1], json.loads(result[2]), result[3]
 
 
-def push(body: QueuePushBody) -> Tuple[str, int]:
-    action = body.action
-    input_data = json.dumps({"data": body.data})
+def push(body: Dict[str, Any]) -> Tuple[str, int]:
+    action = body["action"]
+    input_data = json.dumps({"data": body["data"]})
     hash = generate_hash()
     conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
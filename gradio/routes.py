@@ -2,53 +2,140 @@
 
 from __future__ import annotations
 
-import inspect
-import io
+import functools
+import mimetypes
 import os
 import posixpath
+import re
 import secrets
 import traceback
 import urllib
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type
+from decimal import Decimal
+from pathlib import Path, PurePath
+from typing import Any, Dict, List, Optional, Type
 
+import numpy as np
 import orjson
-import pkg_resources
 import uvicorn
+from anyio.to_thread import current_default_thread_limiter
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from jinja2.exceptions import TemplateNotFound
 from pydantic import BaseModel
-from starlette.responses import RedirectResponse
+from starlette.requests import HTTPConnection
+from starlette.responses import RedirectResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from gradio import encryptor, queueing, utils
 
-STATIC_TEMPLATE_LIB = pkg_resources.resource_filename("gradio", "templates/")
-STATIC_PATH_LIB = pkg_resources.resource_filename("gradio", "templates/frontend/static")
-BUILD_PATH_LIB = pkg_resources.resource_filename("gradio", "templates/frontend/assets")
-VERSION_FILE = pkg_resources.resource_filename("gradio", "version.txt")
-with open(VERSION_FILE) as version_file:
-    VERSION = version_file.read()
-GRADIO_STATIC_ROOT = "https://gradio.s3-us-west-2.amazonaws.com/{}/static/".format(
-    VERSION
+GRADIO_DIR = os.path.dirname(__file__)
+STATIC_TEMPLATE_LIB = os.path.join(GRADIO_DIR, "templates/")
+STATIC_PATH_LIB = os.path.join(GRADIO_DIR, "templates/frontend/static")
+BUILD_PATH_LIB = os.path.join(GRADIO_DIR, "templates/frontend/assets")
+VERSION_FILE = os.path.join(GRADIO_DIR, "version.txt")
+GRADIO_STATIC_ROOT_TEMPLATE = "https://gradio.s3-us-west-2.amazonaws.com/{}/static/"
+GRADIO_BUILD_ROOT_TEMPLATE = "https://gradio.s3-us-west-2.amazonaws.com/{}/assets/"
+# Number of worker threads available to sync routes and predict calls. anyio's
+# default thread limiter of 40 is raised on machines with many cores.
+THREADPOOL_SIZE = int(
+    os.getenv("GRADIO_THREADPOOL_SIZE", max(40, 4 * (os.cpu_count() or 1)))
 )
-GRADIO_BUILD_ROOT = "https://gradio.s3-us-west-2.amazonaws.com/{}/assets/".format(
-    VERSION
+# Decrypted example files served from /file are kept in memory only if they are
+# small, which bounds the cache to DECRYPTED_FILE_CACHE_SIZE entries of at most
+# MAX_CACHED_DECRYPTED_FILE_SIZE bytes each (64 MB in total).
+DECRYPTED_FILE_CACHE_SIZE = 64
+MAX_CACHED_DECRYPTED_FILE_SIZE = 1024 * 1024
+_OS_ALT_SEPS = frozenset(
+    sep for sep in (os.path.sep, os.path.altsep) if sep is not None and sep != "/"
 )
+# Matches a normalized path that escapes its base directory ("..", "../...") or
+# contains an OS-specific separator, in a single scan.
+_UNSAFE_PATH = re.compile(
+    r"^\.\.(?:/|$)" + "".join("|" + re.escape(sep) for sep in sorted(_OS_ALT_SEPS))
+)
+
+
+def orjson_default(obj: Any) -> Any:
+    """Handles the values that orjson can't serialize natively. Numpy arrays that
+    are not C-contiguous are copied into C order, and arrays of unsupported dtypes
+    (e.g. object) and remaining numpy scalars are converted to Python objects.
+    Everything else is coerced the way FastAPI's jsonable_encoder would."""
+    if isinstance(obj, np.ndarray):
+        if not obj.flags.c_contiguous:
+            return np.ascontiguousarray(obj)
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    return jsonable_encoder(obj)
+
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def templates_json_dumps(obj: Any, **kwargs) -> str:
+    """Used by the `tojson` template filter, so that values such as numpy array
+    examples in the config are encoded the same way as API responses."""
+    return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS).decode(
+        "utf-8"
+    )
 
 
 class ORJSONResponse(JSONResponse):
     media_type = "application/json"
 
     def render(self, content: Any) -> bytes:
-        return orjson.dumps(content)
+        return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+@functools.lru_cache(maxsize=None)
+def get_version() -> str:
+    with open(VERSION_FILE) as version_file:
+        return version_file.read().strip()
+
+
+class StaticFilesOrRedirect(StaticFiles):
+    """Serves files from a local directory, or redirects to the copy hosted at
+    remote_root_template (formatted with the gradio version) when the app's
+    blocks are being shared."""
+
+    def __init__(self, server_app: FastAPI, remote_root_template: str, **kwargs):
+        super().__init__(**kwargs)
+        self.server_app = server_app
+        self.remote_root_template = remote_root_template
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.server_app.blocks.share:
+            remote_root = self.remote_root_template.format(get_version())
+            path = self.get_path(scope).replace(os.path.sep, "/")
+            response = RedirectResponse(remote_root + path)
+            await response(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+    async def check_config(self) -> None:
+        # A missing directory (e.g. an unbuilt frontend) is served as 404s rather
+        # than raising on every request.
+        if self.directory is not None and not os.path.isdir(self.directory):
+            return
+        await super().check_config()
 
 
 templates = Jinja2Templates(directory=STATIC_TEMPLATE_LIB)
+templates.env.policies["json.dumps_function"] = templates_json_dumps
 
 
 ###########
@@ -56,15 +143,6 @@ templates = Jinja2Templates(directory=STATIC_TEMPLATE_LIB)
 ###########
 
 
-class PredictBody(BaseModel):
-    session_hash: Optional[str]
-    example_id: Optional[int]
-    data: List[Any]
-    state: Optional[Any]
-    fn_index: Optional[int]
-    cleared: Optional[bool]
-
-
 class FlagData(BaseModel):
     input_data: List[Any]
     output_data: List[Any]
@@ -80,18 +158,23 @@ class InterpretBody(BaseModel):
     data: List[Any]
 
 
-class QueueStatusBody(BaseModel):
-    hash: str
+###########
+# Auth
+###########
 
 
-class QueuePushBody(BaseModel):
-    action: str
-    data: Any
+class UserMiddleware:
+    """Looks up the user for the request's access-token cookie once and stores
+    it in scope["user"], so routes don't need a dependency to resolve it."""
 
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-###########
-# Auth
-###########
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            token = HTTPConnection(scope).cookies.get("access-token")
+            scope["user"] = scope["app"].tokens.get(token)
+        await self.app(scope, receive, send)
 
 
 def create_app() -> FastAPI:
@@ -102,18 +185,25 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(UserMiddleware)
+    app.tokens = {}
     app.state_holder = {}
+    app.state_defaults = {}
+    app.api_docs_html = None
+
+    @app.on_event("startup")
+    async def set_threadpool_size():
+        current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
 
     @app.get("/user")
     @app.get("/user/")
     def get_current_user(request: Request) -> Optional[str]:
-        token = request.cookies.get("access-token")
-        return app.tokens.get(token)
+        return request.scope["user"]
 
     @app.get("/login_check")
     @app.get("/login_check/")
-    def login_check(user: str = Depends(get_current_user)):
-        if app.auth is None or not (user is None):
+    def login_check(request: Request):
+        if app.auth is None or not (request.scope["user"] is None):
             return
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
@@ -123,7 +213,7 @@ def create_app() -> FastAPI:
     @app.get("/token/")
     def get_token(request: Request) -> Optional[str]:
         token = request.cookies.get("access-token")
-        return {"token": token, "user": app.tokens.get(token)}
+        return {"token": token, "user": request.scope["user"]}
 
     @app.post("/login")
     @app.post("/login/")
@@ -148,8 +238,8 @@ def create_app() -> FastAPI:
 
     @app.head("/", response_class=HTMLResponse)
     @app.get("/", response_class=HTMLResponse)
-    def main(request: Request, user: str = Depends(get_current_user)):
-        if app.auth is None or not (user is None):
+    def main(request: Request):
+        if app.auth is None or not (request.scope["user"] is None):
             config = app.blocks.config
         else:
             config = {
@@ -170,32 +260,32 @@ def create_app() -> FastAPI:
     @app.get("/config/", dependencies=[Depends(login_check)])
     @app.get("/config", dependencies=[Depends(login_check)])
     def get_config():
-        return app.blocks.config
-
-    @app.get("/static/{path:path}")
-    def static_resource(path: str):
-        if app.blocks.share:
-            return RedirectResponse(GRADIO_STATIC_ROOT + path)
-        else:
-            static_file = safe_join(STATIC_PATH_LIB, path)
-        if static_file is not None:
-            return FileResponse(static_file)
-        raise HTTPException(status_code=404, detail="Static file not found")
-
-    @app.get("/assets/{path:path}")
-    def build_resource(path: str):
-        if app.blocks.share:
-            return RedirectResponse(GRADIO_BUILD_ROOT + path)
-        else:
-            build_file = safe_join(BUILD_PATH_LIB, path)
-        if build_file is not None:
-            return FileResponse(build_file)
-        raise HTTPException(status_code=404, detail="Build file not found")
+        # Examples may hold numpy arrays, which jsonable_encoder rejects.
+        return ORJSONResponse(app.blocks.config)
+
+    app.mount(
+        "/static",
+        StaticFilesOrRedirect(
+            app, GRADIO_STATIC_ROOT_TEMPLATE, directory=STATIC_PATH_LIB, check_dir=False
+        ),
+        name="static",
+    )
+    app.mount(
+        "/assets",
+        StaticFilesOrRedirect(
+            app, GRADIO_BUILD_ROOT_TEMPLATE, directory=BUILD_PATH_LIB, check_dir=False
+        ),
+        name="assets",
+    )
 
     @app.get("/favicon.ico")
     async def favicon():
         if app.blocks.favicon_path is None:
-            return static_resource("img/logo.svg")
+            if app.blocks.share:
+                return RedirectResponse(
+                    GRADIO_STATIC_ROOT_TEMPLATE.format(get_version()) + "img/logo.svg"
+                )
+            return FileResponse(os.path.join(STATIC_PATH_LIB, "img/logo.svg"))
         else:
             return FileResponse(app.blocks.favicon_path)
 
@@ -206,11 +296,16 @@ def create_app() -> FastAPI:
             and isinstance(app.blocks.examples, str)
             and path.startswith(app.blocks.examples)
         ):
-            with open(safe_join(app.cwd, path), "rb") as encrypted_file:
-                encrypted_data = encrypted_file.read()
-            file_data = encryptor.decrypt(app.blocks.encryption_key, encrypted_data)
-            return FileResponse(
-                io.BytesIO(file_data), attachment_filename=os.path.basename(path)
+            encrypted_file = safe_join(app.cwd, path)
+            if encrypted_file is None:
+                raise HTTPException(status_code=404, detail="File not found")
+            file_data = decrypt_file(encrypted_file, app.blocks.encryption_key)
+            return Response(
+                content=file_data,
+                media_type=mimetypes.guess_type(path)[0],
+                headers={
+                    "Content-Disposition": content_disposition(os.path.basename(path))
+                },
             )
         else:
             if Path(app.cwd).resolve() in Path(path).resolve().parents:
@@ -218,47 +313,18 @@ def create_app() -> FastAPI:
 
     @app.get("/api", response_class=HTMLResponse)  # Needed for Spaces
     @app.get("/api/", response_class=HTMLResponse)
-    def api_docs(request: Request):
-        inputs = [type(inp) for inp in app.blocks.input_components]
-        outputs = [type(out) for out in app.blocks.output_components]
-        input_types_doc, input_types = get_types(inputs, "input")
-        output_types_doc, output_types = get_types(outputs, "output")
-        input_names = [inp.get_block_name() for inp in app.blocks.input_components]
-        output_names = [out.get_block_name() for out in app.blocks.output_components]
-        if app.blocks.examples is not None:
-            sample_inputs = app.blocks.examples[0]
-        else:
-            sample_inputs = [
-                inp.generate_sample() for inp in app.blocks.input_components
-            ]
-        docs = {
-            "inputs": input_names,
-            "outputs": output_names,
-            "len_inputs": len(inputs),
-            "len_outputs": len(outputs),
-            "inputs_lower": [name.lower() for name in input_names],
-            "outputs_lower": [name.lower() for name in output_names],
-            "input_types": input_types,
-            "output_types": output_types,
-            "input_types_doc": input_types_doc,
-            "output_types_doc": output_types_doc,
-            "sample_inputs": sample_inputs,
-            "auth": app.blocks.auth,
-            "local_login_url": urllib.parse.urljoin(app.blocks.local_url, "login"),
-            "local_api_url": urllib.parse.urljoin(app.blocks.local_url, "api/predict"),
-        }
-        return templates.TemplateResponse("api_docs.html", {"request": request, **docs})
+    def api_docs():
+        if app.api_docs_html is None:
+            app.api_docs_html = build_api_docs_html(app)
+        return HTMLResponse(app.api_docs_html)
 
     @app.post("/api/predict/", dependencies=[Depends(login_check)])
-    async def predict(request: Request, username: str = Depends(get_current_user)):
-        body = await request.json()
+    async def predict(request: Request):
+        username = request.scope["user"]
+        body = await get_json_body(request)
         if "session_hash" in body:
             if body["session_hash"] not in app.state_holder:
-                app.state_holder[body["session_hash"]] = {
-                    _id: getattr(block, "default_value", None)
-                    for _id, block in app.blocks.blocks.items()
-                    if getattr(block, "stateful", False)
-                }
+                app.state_holder[body["session_hash"]] = dict(app.state_defaults)
             session_state = app.state_holder[body["session_hash"]]
         else:
             session_state = {}
@@ -269,23 +335,31 @@ def create_app() -> FastAPI:
                 username,
                 session_state,
             )
+            # Returning a response directly skips FastAPI's jsonable_encoder pass
+            # over the (potentially large) output; orjson encodes it on its own.
+            return ORJSONResponse(output)
         except BaseException as error:
             if app.blocks.show_error:
                 traceback.print_exc()
                 return JSONResponse(content={"error": str(error)}, status_code=500)
             else:
                 raise error
-        return output
 
     @app.post("/api/queue/push/", dependencies=[Depends(login_check)])
-    async def queue_push(body: QueuePushBody):
+    async def queue_push(request: Request):
+        body = await get_json_body(request, "action", "data")
         job_hash, queue_position = queueing.push(body)
         return {"hash": job_hash, "queue_position": queue_position}
 
     @app.post("/api/queue/status/", dependencies=[Depends(login_check)])
-    async def queue_status(body: QueueStatusBody):
-        status, data = queueing.get_status(body.hash)
-        return {"status": status, "data": data}
+    async def queue_status(request: Request):
+        body = await get_json_body(request, "hash")
+        status, data = queueing.get_status(body["hash"])
+        if data is None:
+            return Response(
+                get_queue_status_body(status), media_type="application/json"
+            )
+        return ORJSONResponse({"status": status, "data": data})
 
     return app
 
@@ -295,42 +369,117 @@ def create_app() -> FastAPI:
 ########
 
 
+async def get_json_body(request: Request, *required_keys: str) -> Dict[str, Any]:
+    """Parses the request body as a JSON object, responding with a 422 if it is not
+    valid JSON or is missing any of the required keys."""
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Request body is not valid JSON.",
+        )
+    if not isinstance(body, dict):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Request body must be a JSON object.",
+        )
+    missing_keys = [key for key in required_keys if key not in body]
+    if missing_keys:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Request body is missing: {}".format(", ".join(missing_keys)),
+        )
+    return body
+
+
 def safe_join(directory: str, path: str) -> Optional[str]:
     """Safely path to a base directory to avoid escaping the base directory.
     Borrowed from: werkzeug.security.safe_join"""
-    _os_alt_seps: List[str] = list(
-        sep for sep in [os.path.sep, os.path.altsep] if sep is not None and sep != "/"
-    )
-
     if path != "":
         filename = posixpath.normpath(path)
 
-    if (
-        any(sep in filename for sep in _os_alt_seps)
-        or os.path.isabs(filename)
-        or filename == ".."
-        or filename.startswith("../")
-    ):
+    if _UNSAFE_PATH.search(filename) or os.path.isabs(filename):
         return None
     return posixpath.join(directory, filename)
 
 
-def get_types(cls_set: List[Type], component: str):
-    docset = []
-    types = []
-    if component == "input":
-        for cls in cls_set:
-            doc = inspect.getdoc(cls.preprocess)
-            doc_lines = doc.split("\n")
-            docset.append(doc_lines[1].split(":")[-1])
-            types.append(doc_lines[1].split(")")[0].split("(")[-1])
+@functools.lru_cache(maxsize=None)
+def get_queue_status_body(status: str) -> bytes:
+    """Encoded response for a status poll that carries no data. There are only a
+    handful of such statuses, and clients poll them repeatedly."""
+    return orjson.dumps({"status": status, "data": None})
+
+
+def decrypt_file(path: str, key: bytes) -> bytes:
+    """Reads and decrypts an encrypted example file, caching the result if the
+    file is small enough."""
+    stat = os.stat(path)
+    if stat.st_size > MAX_CACHED_DECRYPTED_FILE_SIZE:
+        return read_and_decrypt_file(path, key)
+    return cached_decrypt_file(path, stat.st_mtime, key)
+
+
+def read_and_decrypt_file(path: str, key: bytes) -> bytes:
+    with open(path, "rb") as encrypted_file:
+        encrypted_data = encrypted_file.read()
+    return encryptor.decrypt(key, encrypted_data)
+
+
+@functools.lru_cache(maxsize=DECRYPTED_FILE_CACHE_SIZE)
+def cached_decrypt_file(path: str, mtime: float, key: bytes) -> bytes:
+    """The modification time is only part of the cache key, so that edited files
+    are decrypted again."""
+    return read_and_decrypt_file(path, key)
+
+
+def content_disposition(filename: str) -> str:
+    """Builds an attachment Content-Disposition header the way Starlette's
+    FileResponse does, so names that are not Latin-1 or contain quotes still
+    produce a valid header."""
+    quoted_filename = urllib.parse.quote(filename)
+    if quoted_filename != filename:
+        return "attachment; filename*=utf-8''{}".format(quoted_filename)
+    return 'attachment; filename="{}"'.format(filename)
+
+
+def build_api_docs_html(app: FastAPI) -> bytes:
+    """Renders the /api docs page once. Everything on it depends only on
+    app.blocks, which does not change after launch, so the result is cached
+    on the app and served as-is."""
+    inputs = [type(inp) for inp in app.blocks.input_components]
+    outputs = [type(out) for out in app.blocks.output_components]
+    input_types_doc, input_types = get_types(inputs, "input")
+    output_types_doc, output_types = get_types(outputs, "output")
+    input_names = [inp.get_block_name() for inp in app.blocks.input_components]
+    output_names = [out.get_block_name() for out in app.blocks.output_components]
+    if app.blocks.examples is not None:
+        sample_inputs = app.blocks.examples[0]
     else:
-        for cls in cls_set:
-            doc = inspect.getdoc(cls.postprocess)
-            doc_lines = doc.split("\n")
-            docset.append(doc_lines[-1].split(":")[-1])
-            types.append(doc_lines[-1].split(")")[0].split("(")[-1])
-    return docset, types
+        sample_inputs = [inp.generate_sample() for inp in app.blocks.input_components]
+    docs = {
+        "inputs": input_names,
+        "outputs": output_names,
+        "len_inputs": len(inputs),
+        "len_outputs": len(outputs),
+        "inputs_lower": [name.lower() for name in input_names],
+        "outputs_lower": [name.lower() for name in output_names],
+        "input_types": input_types,
+        "output_types": output_types,
+        "input_types_doc": input_types_doc,
+        "output_types_doc": output_types_doc,
+        "sample_inputs": sample_inputs,
+        "auth": app.blocks.auth,
+        "local_login_url": urllib.parse.urljoin(app.blocks.local_url, "login"),
+        "local_api_url": urllib.parse.urljoin(app.blocks.local_url, "api/predict"),
+    }
+    return templates.get_template("api_docs.html").render(**docs).encode("utf-8")
+
+
+def get_types(cls_set: List[Type], component: str):
+    attr = "preprocess_doc" if component == "input" else "postprocess_doc"
+    docs = [getattr(cls, attr) for cls in cls_set]
+    return [doc for _, doc in docs], [type_ for type_, _ in docs]
 
 
 def get_state():
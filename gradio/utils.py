@@ -16,7 +16,6 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List
 
 import aiohttp
 import analytics
-import pkg_resources
 import requests
 
 import gradio
@@ -31,6 +30,9 @@ JSON_PATH = os.path.join(os.path.dirname(gradio.__file__), "launches.json")
 
 
 def version_check():
+    # pkg_resources is slow to import, so only load it when the check runs.
+    import pkg_resources
+
     try:
         current_pkg_version = pkg_resources.require("gradio")[0].version
         latest_pkg_version = requests.get(url=PKG_VERSION_URL).json()["version"]
@@ -211,7 +213,7 @@ def get_config_file(interface: Interface) -> Dict[str, Any]:
         "cached_examples": interface.cache_examples
         if hasattr(interface, "cache_examples")
         else False,
-        "version": pkg_resources.require("gradio")[0].version,
+        "version": gradio.__version__,
         "favicon_path": interface.favicon_path,
     }
     try:
@@ -38,7 +38,7 @@ setup(
         "python-multipart",
         "pydub",
         "requests",
-        "uvicorn",
+        "uvicorn[standard]",
         "Jinja2"
     ],
 )
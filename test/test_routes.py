@@ -1,12 +1,20 @@
 """Contains tests for networking.py and app.py"""
 
 import os
+import shutil
+import tempfile
 import unittest
 import unittest.mock as mock
+from decimal import Decimal
+from pathlib import Path
 
+import numpy as np
+import orjson
+from anyio.to_thread import current_default_thread_limiter
 from fastapi.testclient import TestClient
 
-from gradio import Interface, queueing, reset_all
+from gradio import Interface, encryptor, queueing, reset_all, routes
+from gradio.routes import ORJSONResponse, safe_join, templates_json_dumps
 
 os.environ["GRADIO_ANALYTICS_ENABLED"] = "False"
 
@@ -21,9 +29,9 @@ class TestRoutes(unittest.TestCase):
         response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
 
-    # def test_get_api_route(self):
-    #     response = self.client.get("/api/")
-    #     self.assertEqual(response.status_code, 200)
+    def test_get_api_route(self):
+        response = self.client.get("/api/")
+        self.assertEqual(response.status_code, 200)
 
     def test_static_files_served_safely(self):
         # Make sure things outside the static folder are not accessible
@@ -32,10 +40,52 @@ class TestRoutes(unittest.TestCase):
         response = self.client.get(r"/static/..%2f..%2fapi_docs.html")
         self.assertEqual(response.status_code, 404)
 
+    def test_static_files_redirect_when_shared(self):
+        self.io.share = True
+        response = self.client.get("/assets/index.js", allow_redirects=False)
+        self.assertEqual(response.status_code, 307)
+        self.assertTrue(response.headers["location"].endswith("/assets/index.js"))
+
     def test_get_config_route(self):
         response = self.client.get("/config/")
         self.assertEqual(response.status_code, 200)
 
+    def test_numpy_examples(self):
+        io = Interface(
+            lambda x: x, "dataframe", "dataframe", examples=[[np.zeros((2, 2))]]
+        )
+        app, _, _ = io.launch(prevent_thread_lock=True)
+        client = TestClient(app)
+        for route in ["/", "/config/", "/api/"]:
+            response = client.get(route)
+            self.assertEqual(response.status_code, 200)
+        io.close()
+
+    def test_encrypted_example_with_non_ascii_name(self):
+        key = encryptor.get_key("password")
+        examples_dir = tempfile.mkdtemp(dir=os.getcwd())
+        self.addCleanup(shutil.rmtree, examples_dir)
+        with open(os.path.join(examples_dir, "例子.txt"), "wb") as f:
+            f.write(encryptor.encrypt(key, b"example data"))
+        self.io.encrypt = True
+        self.io.encryption_key = key
+        self.io.examples = os.path.relpath(examples_dir)
+        response = self.client.get("/file/{}/例子.txt".format(self.io.examples))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"example data")
+        self.assertEqual(
+            response.headers["content-disposition"],
+            "attachment; filename*=utf-8''%E4%BE%8B%E5%AD%90.txt",
+        )
+
+    def test_threadpool_size_applied_on_startup(self):
+        with mock.patch.object(routes, "THREADPOOL_SIZE", 7):
+            with TestClient(self.app) as client:
+                total_tokens = client.portal.call(
+                    lambda: current_default_thread_limiter().total_tokens
+                )
+        self.assertEqual(total_tokens, 7)
+
     def test_predict_route(self):
         response = self.client.post(
             "/api/predict/", json={"data": ["test"], "fn_index": 0}
@@ -44,6 +94,15 @@ class TestRoutes(unittest.TestCase):
         output = dict(response.json())
         self.assertEqual(output["data"], ["testtest"])
 
+    def test_predict_route_coerces_output(self):
+        io = Interface(lambda x: {"set": {1, 2}, "bytes": b"xy"}, "text", "json")
+        app, _, _ = io.launch(prevent_thread_lock=True)
+        client = TestClient(app)
+        response = client.post("/api/predict/", json={"data": ["test"], "fn_index": 0})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"], [{"set": [1, 2], "bytes": "xy"}])
+        io.close()
+
     def test_state(self):
         def predict(input, history):
             if history is None:
@@ -80,6 +139,14 @@ class TestRoutes(unittest.TestCase):
         response = self.client.post("/api/queue/status/", json={"hash": "test"})
         self.assertEqual(response.status_code, 200)
 
+    def test_queue_routes_reject_malformed_bodies(self):
+        response = self.client.post("/api/queue/status/", json={})
+        self.assertEqual(response.status_code, 422)
+        response = self.client.post("/api/queue/push/", json={"data": "test"})
+        self.assertEqual(response.status_code, 422)
+        response = self.client.post("/api/queue/status/", data="not json")
+        self.assertEqual(response.status_code, 422)
+
     def tearDown(self) -> None:
         self.io.close()
         reset_all()
@@ -103,10 +170,81 @@ class TestAuthenticatedRoutes(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
+    def test_unauthenticated_requests(self):
+        response = self.client.get("/user/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json())
+        response = self.client.get("/config/")
+        self.assertEqual(response.status_code, 401)
+
     def tearDown(self) -> None:
         self.io.close()
         reset_all()
 
 
+class TestORJSONResponse(unittest.TestCase):
+    def test_numpy_content(self):
+        array = np.arange(6).reshape(2, 3)
+        response = ORJSONResponse(
+            {"transposed": array.T, "objects": np.array(["a", 1], dtype=object)}
+        )
+        self.assertEqual(
+            orjson.loads(response.body),
+            {"transposed": [[0, 3], [1, 4], [2, 5]], "objects": ["a", 1]},
+        )
+
+    def test_content_coerced_like_jsonable_encoder(self):
+        response = ORJSONResponse(
+            {
+                "set": {1, 2},
+                "decimal": Decimal("1.5"),
+                "bytes": b"xy",
+                "path": Path("a"),
+            }
+        )
+        self.assertEqual(
+            orjson.loads(response.body),
+            {"set": [1, 2], "decimal": 1.5, "bytes": "xy", "path": "a"},
+        )
+
+    def test_numpy_examples_in_templates(self):
+        self.assertEqual(
+            templates_json_dumps({"examples": [[np.zeros((2, 2))]]}),
+            '{"examples":[[[[0.0,0.0],[0.0,0.0]]]]}',
+        )
+
+
+class TestSafeJoin(unittest.TestCase):
+    def test_safe_join(self):
+        self.assertEqual(safe_join("/base", "img/logo.svg"), "/base/img/logo.svg")
+        self.assertEqual(safe_join("/base", "img/../logo.svg"), "/base/logo.svg")
+        self.assertIsNone(safe_join("/base", "../index.html"))
+        self.assertIsNone(safe_join("/base", "img/../../index.html"))
+        self.assertIsNone(safe_join("/base", ".."))
+        self.assertIsNone(safe_join("/base", "/etc/passwd"))
+
+
+class TestDecryptFile(unittest.TestCase):
+    def setUp(self):
+        self.key = encryptor.get_key("password")
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(encryptor.encrypt(self.key, b"example data"))
+        self.path = f.name
+        routes.cached_decrypt_file.cache_clear()
+
+    def test_small_files_are_cached(self):
+        self.assertEqual(routes.decrypt_file(self.path, self.key), b"example data")
+        self.assertEqual(routes.decrypt_file(self.path, self.key), b"example data")
+        self.assertEqual(routes.cached_decrypt_file.cache_info().hits, 1)
+
+    def test_large_files_are_not_cached(self):
+        with mock.patch.object(routes, "MAX_CACHED_DECRYPTED_FILE_SIZE", 1):
+            self.assertEqual(routes.decrypt_file(self.path, self.key), b"example data")
+        self.assertEqual(routes.cached_decrypt_file.cache_info().currsize, 0)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+
 if __name__ == "__main__":
     unittest.main()